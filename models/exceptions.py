@@ -8,7 +8,10 @@ from odoo.exceptions import UserError
 class HTTPClientError(UserError):
     """Base exception for all HTTP client errors."""
 
-    def __init__(self, message):
+    def __init__(self, message, original_error=None):
+        self.original_error = original_error
+        if original_error:
+            message = f"{message} - Original error: {str(original_error)}"
         super(HTTPClientError, self).__init__(message)
 
 
@@ -16,10 +19,7 @@ class ConnectionInitError(HTTPClientError):
     """Base exception for connection initialization errors."""
 
     def __init__(self, message, original_error=None):
-        self.original_error = original_error
-        if original_error:
-            message = f"{message} - Original error: {str(original_error)}"
-        super(ConnectionInitError, self).__init__(message)
+        super(ConnectionInitError, self).__init__(message, original_error)
 
 
 class PoolManagerInitError(ConnectionInitError):
@@ -50,17 +50,11 @@ class RequestError(HTTPClientError):
     """Exception raised when a request fails."""
 
     def __init__(self, message, original_error=None):
-        self.original_error = original_error
-        if original_error:
-            message = f"{message} - Original error: {str(original_error)}"
-        super(RequestError, self).__init__(message)
+        super(RequestError, self).__init__(message, original_error)
 
 
 class URLOpenError(HTTPClientError):
     """Exception raised when urlopen fails."""
 
     def __init__(self, message, original_error=None):
-        self.original_error = original_error
-        if original_error:
-            message = f"{message} - Original error: {str(original_error)}"
-        super(URLOpenError, self).__init__(message)
+        super(URLOpenError, self).__init__(message, original_error)
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
 from odoo.models import BaseModel
 from odoo import api
@@ -10,17 +11,140 @@ from urllib3.exceptions import (
     SSLError, ReadTimeoutError, ConnectTimeoutError, ClosedPoolError,
     EmptyPoolError, FullPoolError, URLSchemeUnknown
 )
+from types import MappingProxyType
 from typing import Dict
-import urllib.parse
+from weakref import WeakKeyDictionary
+from urllib.parse import urlencode, urlparse, urlunparse, parse_qsl
 
 import urllib3
 import logging
+import os
 
-from .exceptions import (HTTPClientError, ConnectionInitError, RequestError, URLOpenError)
+from .exceptions import (ConnectionInitError, RequestError, URLOpenError)
 
 _logger = logging.getLogger(__name__)
 
 
+def _find_caller(stack_info=False, stacklevel=1):
+    """Skip the stack walk of ``Logger.findCaller`` for this module's records.
+
+    Error paths log on every failed request and the frame lookup is a large share of the
+    cost of each record. The tradeoff is that records of this logger carry no
+    %(pathname)s / %(lineno)d information, which the default Odoo log format does not use.
+    Setting ``logging._srcfile = None`` would do the same for every logger of the process.
+    """
+    return "(unknown file)", 0, "(unknown function)", None
+
+
+_logger.findCaller = _find_caller
+
+# Default number of connections kept alive per pool, scaled like ThreadPoolExecutor's max_workers
+_DEFAULT_POOL_MAXSIZE = min(32, (os.cpu_count() or 1) * 5)
+
+# Default pool headers, used when a model does not declare its own. The mapping is shared by
+# every pool, so it is read-only: copy it before adding headers.
+DEFAULT_HEADERS = MappingProxyType(make_headers(accept_encoding=True, keep_alive=True))
+
+# Connection pool defaults, overridden by the model's _http_connection
+_BASE_OPTIONS = {
+    'timeout': Timeout.DEFAULT_TIMEOUT,
+    'maxsize': _DEFAULT_POOL_MAXSIZE,
+    'retries': None,
+    'block': False,
+}
+
+# Error messages keyed by exception type, resolved against the raised exception's MRO
+# so the most specific entry wins.
+_CONNECTION_ERRORS = {
+    LocationValueError: "Invalid connection parameters",
+    ValueError: "Invalid connection parameters",
+    URLSchemeUnknown: "Unknown URL scheme",
+    TimeoutError: "Connection timeout",
+    ConnectTimeoutError: "Connection timeout",
+    SSLError: "SSL or proxy error",
+    ProxyError: "SSL or proxy error",
+    ClosedPoolError: "Pool error",
+    EmptyPoolError: "Pool error",
+    FullPoolError: "Pool error",
+    NewConnectionError: "Failed to establish a new connection",
+    HTTPError: "HTTP error",
+}
+
+_REQUEST_ERRORS = {
+    TimeoutError: "Request timeout",
+    ReadTimeoutError: "Request timeout",
+    ConnectTimeoutError: "Request timeout",
+    SSLError: "SSL or proxy error",
+    ProxyError: "SSL or proxy error",
+    HostChangedError: "Host changed error",
+    MaxRetryError: "Max retries exceeded",
+    NewConnectionError: "Connection error",
+    ProtocolError: "Protocol error",
+    HTTPError: "HTTP error",
+}
+
+
+def _lookup_error_message(table, error, default="Unexpected error"):
+    """Return the message registered for the closest type of ``error`` in ``table``."""
+    for error_type in type(error).__mro__:
+        message = table.get(error_type)
+        if message is not None:
+            return message
+    return default
+
+
+_VERB_DOC = """Make a%s %s request.
+
+Args:
+    url (str): URL to request
+    fields (dict, optional): %s
+    headers (dict, optional): HTTP headers to include in the request
+    params (dict, optional): Query parameters to include in the request
+    **kwargs: Additional arguments to pass to the underlying request method
+
+Returns:
+    urllib3.response.HTTPResponse: The HTTP response
+
+Raises:
+    RequestError: If an error occurs during the request
+"""
+
+
+def _name_verb(method, verb, fields_doc):
+    """Give a generated REST method the name and docstring of a hand-written one."""
+    method.__name__ = verb.lower()
+    method.__qualname__ = f"HTTPAbstract.{method.__name__}"
+    method.__doc__ = _VERB_DOC % ('n' if verb[0] in 'AEIOU' else '', verb, fields_doc)
+    return method
+
+
+def _query_verb(verb):
+    """Build a REST method whose query parameters are passed as request 'fields'."""
+
+    def method(self, url, fields=None, headers=None, params=None, **kwargs):
+        if params:
+            if fields is None:
+                fields = params
+            else:
+                # Copy then update in C: unlike dict(fields, **params) it accepts non-str keys
+                fields = dict(fields)
+                fields.update(params)
+        return self.request(verb, url, fields=fields, headers=headers, **kwargs)
+
+    return _name_verb(method, verb, "Form fields to include in the request")
+
+
+def _body_verb(verb):
+    """Build a REST method whose query parameters must be manually encoded in the URL."""
+
+    def method(self, url, fields=None, headers=None, params=None, **kwargs):
+        if params:
+            url = self._prepare_url(url, params)
+        return self.request(verb, url, fields=fields, headers=headers, **kwargs)
+
+    return _name_verb(method, verb, "Form fields or JSON data to include in the request")
+
+
 class HTTPAbstract(BaseModel):
     """Base abstract model for HTTP connections.
 
@@ -30,7 +154,11 @@ class HTTPAbstract(BaseModel):
     _description = 'HTTP Abstract Model'
 
     _http_connection = {}
-    _connection_cache = {}  # Class-level cache for connections
+    # Registry of live connections by model class, for introspection only. Classes hash by
+    # identity and weak keys let the classes of a reloaded registry be collected.
+    _connection_cache = WeakKeyDictionary()
+    _cached_connection = None  # Connection owned by the model class, see _get_connection
+    _cached_options = None  # Static connection options of the model class, see _get_options
 
     @contextmanager
     def _handle_connection_exceptions(self, error_class=ConnectionInitError):
@@ -48,30 +176,10 @@ class HTTPAbstract(BaseModel):
         """
         try:
             yield
-        except (LocationValueError, ValueError) as e:
-            _logger.error("Invalid connection parameters: %s", str(e))
-            raise error_class("Invalid connection parameters", e)
-        except URLSchemeUnknown as e:
-            _logger.error("Unknown URL scheme: %s", str(e))
-            raise error_class("Unknown URL scheme", e)
-        except (TimeoutError, ConnectTimeoutError) as e:
-            _logger.error("Connection timeout: %s", str(e))
-            raise error_class("Connection timeout", e)
-        except (SSLError, ProxyError) as e:
-            _logger.error("SSL or proxy error: %s", str(e))
-            raise error_class("SSL or proxy error", e)
-        except (ClosedPoolError, EmptyPoolError, FullPoolError) as e:
-            _logger.error("Pool error: %s", str(e))
-            raise error_class("Pool error", e)
-        except NewConnectionError as e:
-            _logger.error("Failed to establish a new connection: %s", str(e))
-            raise error_class("Failed to establish a new connection", e)
-        except HTTPError as e:
-            _logger.error("HTTP error: %s", str(e))
-            raise error_class("HTTP error", e)
         except Exception as e:
-            _logger.error("Unexpected error: %s", str(e))
-            raise error_class("Unexpected error", e)
+            message = _lookup_error_message(_CONNECTION_ERRORS, e)
+            _logger.error("%s: %s", message, e)
+            raise error_class(message, e) from None
 
     @contextmanager
     def _handle_request_exceptions(self, method, url, error_class=RequestError):
@@ -91,30 +199,10 @@ class HTTPAbstract(BaseModel):
         """
         try:
             yield
-        except (TimeoutError, ReadTimeoutError, ConnectTimeoutError) as e:
-            _logger.error("Request timeout for %s %s: %s", method, url, str(e))
-            raise error_class(f"Request timeout for {method} {url}", e)
-        except (SSLError, ProxyError) as e:
-            _logger.error("SSL or proxy error for %s %s: %s", method, url, str(e))
-            raise error_class(f"SSL or proxy error for {method} {url}", e)
-        except HostChangedError as e:
-            _logger.error("Host changed error for %s %s: %s", method, url, str(e))
-            raise error_class(f"Host changed error for {method} {url}", e)
-        except MaxRetryError as e:
-            _logger.error("Max retries exceeded for %s %s: %s", method, url, str(e))
-            raise error_class(f"Max retries exceeded for {method} {url}", e)
-        except NewConnectionError as e:
-            _logger.error("Connection error for %s %s: %s", method, url, str(e))
-            raise error_class(f"Connection error for {method} {url}", e)
-        except ProtocolError as e:
-            _logger.error("Protocol error for %s %s: %s", method, url, str(e))
-            raise error_class(f"Protocol error for {method} {url}", e)
-        except HTTPError as e:
-            _logger.error("HTTP error for %s %s: %s", method, url, str(e))
-            raise error_class(f"HTTP error for {method} {url}", e)
         except Exception as e:
-            _logger.error("Unexpected error for %s %s: %s", method, url, str(e))
-            raise error_class(f"Unexpected error for {method} {url}", e)
+            message = _lookup_error_message(_REQUEST_ERRORS, e)
+            _logger.error("%s for %s %s: %s", message, method, url, e)
+            raise error_class(f"{message} for {method} {url}", e) from None
 
     @classmethod
     def _set_http_connection(cls, values):
@@ -122,8 +210,10 @@ class HTTPAbstract(BaseModel):
         Set/Change the HTTP connection options.
         Avoid using _set_http_connection instead, declare http_connection attribute in class definition.
         If you require multiple connections, use PoolManagerAbstract"""
+        if not isinstance(values, dict):
+            raise TypeError(f"{cls._name}._http_connection must be a dict")
         cls._http_connection = values
-
+        cls._cached_options = None
 
     @classmethod
     def _register_hook(cls):
@@ -131,16 +221,19 @@ class HTTPAbstract(BaseModel):
 
         This method is called by Odoo after the model is fully initialized and registered.
         It's the perfect place to initialize any necessary connection configurations.
+        It also validates ``_http_connection`` once, so later option lookups can trust it.
         """
-        _logger.info("Initializing configurations for %s", cls._name)
-        # Clear any existing connections for this model
-        if cls._name in cls._connection_cache:
-            cls._connection_cache[cls._name] = None
+        if not isinstance(getattr(cls, '_http_connection', None), dict):
+            raise TypeError(f"{cls._name}._http_connection must be a dict")
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("Initializing configurations for %s", cls._name)
+        # Clear any existing connections and options for this model
+        cls._cached_connection = None
+        cls._cached_options = None
+        cls._connection_cache.pop(cls, None)
 
     def _get_http_connection(self):
         """Get the HTTP connection options. Avoid accessing the _ http_connection attribute directly."""
-        if not isinstance(self._http_connection, dict):
-            return {}
         return self._http_connection
 
     def _init_connection(self):
@@ -156,19 +249,21 @@ class HTTPAbstract(BaseModel):
     def _get_connection(self):
         """Get the underlying connection object.
 
-        Checks the class-level cache first, then lazily initializes the connection if needed.
+        Checks the model class slot first, then lazily initializes the connection if needed.
+        The slot is read from the class ``__dict__`` so a model never picks up the connection
+        of the model it inherits from.
 
         Returns:
             The connection object
         """
-        # Try to get the connection from the class-level cache
-        if self._name in self._connection_cache and self._connection_cache[self._name]:
-            return self._connection_cache[self._name]
+        cls = type(self)
+        connection = cls.__dict__.get('_cached_connection')
+        if connection is not None:
+            return connection
 
-        # If not in cache or None, initialize it
-        connection = self._init_connection()
-        # Store in class-level cache for reuse
-        self._connection_cache[self._name] = connection
+        # If not cached yet, initialize it and store it on the model class for reuse
+        connection = cls._cached_connection = self._init_connection()
+        self._connection_cache[cls] = connection
 
         return connection
 
@@ -186,41 +281,50 @@ class HTTPAbstract(BaseModel):
             dict: A dictionary representing the HTTP headers to be used for the
                   connection.
         """
-        headers = self._get_http_connection().get('headers', make_headers(accept_encoding=True))
+        headers = self._get_http_connection().get('headers')
+        auth_headers = self.set_auth_headers()
+        if headers is None and not auth_headers:
+            # Nothing declared nor merged, every pool shares the same read-only default
+            return DEFAULT_HEADERS
+        # urllib3 may pop auth headers from the pool headers in place on a cross-host redirect,
+        # so the class-level declared dict is never handed out as is
         return {
-            **self.set_auth_headers(),
-            **headers,
+            **(auth_headers or {}),
+            **(DEFAULT_HEADERS if headers is None else headers),
         }
 
     def _get_options(self) -> Dict:
         """Get default connection options.
 
+        The defaults merged with ``_http_connection`` are computed once per model class;
+        headers are rebuilt on every call so authentication headers stay current.
+
         Returns:
             dict: Default connection options
         """
-
-        if not hasattr(self, '_http_connection'):
-            raise AttributeError("'_http_connection' attribute not found")
+        cls = type(self)
+        options = cls.__dict__.get('_cached_options')
+        if options is None:
+            options = cls._cached_options = {**_BASE_OPTIONS, **self._get_http_connection()}
 
         return {
-            'timeout': Timeout.DEFAULT_TIMEOUT,
-            'maxsize': 1,
-            'retries': None,
-            'block': False,
-            **self._get_http_connection(),
+            **options,
             'headers': self._build_headers(),
         }
 
     @api.model
     def _prepare_url(self, url, params=None):
         """Prepare a URL for a POST PUT request."""
-        if params:
-            url_parts = list(urllib.parse.urlparse(url))
-            query = dict(urllib.parse.parse_qsl(url_parts[4]))
-            query.update(params)
-            url_parts[4] = urllib.parse.urlencode(query)
-            url = urllib.parse.urlunparse(url_parts)
-        return url
+        if not params:
+            return url
+        # Common case: nothing to merge with, append the encoded query directly
+        if '?' not in url and '#' not in url:
+            return f"{url}?{urlencode(params)}"
+        url_parts = list(urlparse(url))
+        query = dict(parse_qsl(url_parts[4]))
+        query.update(params)
+        url_parts[4] = urlencode(query)
+        return urlunparse(url_parts)
 
     def request(self, method, url, fields=None, headers=None, **kwargs):
         """Make an HTTP request.
@@ -243,6 +347,68 @@ class HTTPAbstract(BaseModel):
         with self._handle_request_exceptions(method, url):
             return conn.request(method, url, fields=fields, headers=headers, **kwargs)
 
+    def request_many(self, requests, max_workers=None, return_exceptions=False):
+        """Make several HTTP requests concurrently over the model's connection.
+
+        Each request goes through request(), so overrides of it (signing, logging...) apply.
+
+        Warning:
+            With more than one request, request() runs concurrently in worker threads on the
+            same environment and cursor as the caller. Neither the cursor nor the ORM cache are
+            thread-safe: overrides of request() called from here must not touch self.env nor
+            read records that are not already in cache (no ir.config_parameter lookup, no
+            credentials read through the ORM...). Resolve such data in the calling thread
+            beforehand, e.g. through set_auth_headers() which builds the pool headers.
+
+        Args:
+            requests (list): Requests as dicts with 'method' and 'url' keys, plus any other
+                             keyword argument accepted by request() ('fields', 'headers', ...).
+                             An optional 'sender' key holds the callable used instead of
+                             self.request, with the same signature, e.g. the request() of the
+                             record the request belongs to.
+            max_workers (int, optional): Number of worker threads. Defaults to the number of
+                                         requests, capped by the pool maxsize.
+            return_exceptions (bool, optional): Yield the RequestError of a failed request in
+                                                place of its response instead of raising it.
+
+        Yields:
+            tuple: (request dict, urllib3.response.HTTPResponse) pairs, as responses complete
+
+        Raises:
+            RequestError: If an error occurs during one of the requests
+        """
+        requests = list(requests)
+        if not requests:
+            return
+
+        # Initialize the connection in the calling thread, workers only reuse it
+        self._get_connection()
+
+        def send(req):
+            kwargs = dict(req)
+            method = kwargs.pop('method')
+            url = kwargs.pop('url')
+            sender = kwargs.pop('sender', None) or self.request
+            try:
+                return sender(method, url, **kwargs)
+            except RequestError as e:
+                if return_exceptions:
+                    return e
+                raise
+
+        if len(requests) == 1:
+            # Nothing to overlap, spare the thread pool
+            yield requests[0], send(requests[0])
+            return
+
+        # More workers than pool slots would open connections the pool then discards (block=False)
+        maxsize = self._get_http_connection().get('maxsize', _DEFAULT_POOL_MAXSIZE)
+        max_workers = max_workers or min(len(requests), maxsize)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(send, req): req for req in requests}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
     @api.model
     def set_auth_headers(self):
         """ Override method for set the auth headers."""
@@ -270,192 +436,36 @@ class HTTPAbstract(BaseModel):
 
     # REST methods
 
-    def get(self, url, fields=None, headers=None, params=None, **kwargs):
-        """Make a GET request.
-
-        Args:
-            url (str): URL to request
-            fields (dict, optional): Form fields to include in the request
-            headers (dict, optional): HTTP headers to include in the request
-            params (dict, optional): Query parameters to include in the request
-            **kwargs: Additional arguments to pass to the underlying request method
-
-        Returns:
-            urllib3.response.HTTPResponse: The HTTP response
-
-        Raises:
-            RequestError: If an error occurs during the request
-        """
-        # For GET requests, query parameters are passed as 'fields'
-        if params:
-            fields = params if fields is None else {**fields, **params}
-        return self.request('GET', url, fields=fields, headers=headers, **kwargs)
-
-    def post(self, url, fields=None, headers=None, params=None, **kwargs):
-        """Make a POST request.
-
-        Args:
-            url (str): URL to request
-            fields (dict, optional): Form fields or JSON data to include in the request
-            headers (dict, optional): HTTP headers to include in the request
-            params (dict, optional): Query parameters to include in the request
-            **kwargs: Additional arguments to pass to the underlying request method
-
-        Returns:
-            urllib3.response.HTTPResponse: The HTTP response
-
-        Raises:
-            RequestError: If an error occurs during the request
-        """
-        # For POST requests, query parameters must be manually encoded in the URL
-        url = self._prepare_url(url, params)
-        return self.request('POST', url, fields=fields, headers=headers, **kwargs)
-
-    def put(self, url, fields=None, headers=None, params=None, **kwargs):
-        """Make a PUT request.
-
-        Args:
-            url (str): URL to request
-            fields (dict, optional): Form fields or JSON data to include in the request
-            headers (dict, optional): HTTP headers to include in the request
-            params (dict, optional): Query parameters to include in the request
-            **kwargs: Additional arguments to pass to the underlying request method
-
-        Returns:
-            urllib3.response.HTTPResponse: The HTTP response
-
-        Raises:
-            RequestError: If an error occurs during the request
-        """
-        # For PUT requests, query parameters must be manually encoded in the URL
-        url = self._prepare_url(url, params)
-        return self.request('PUT', url, fields=fields, headers=headers, **kwargs)
-
-    def delete(self, url, fields=None, headers=None, params=None, **kwargs):
-        """Make a DELETE request.
-
-        Args:
-            url (str): URL to request
-            fields (dict, optional): Form fields to include in the request
-            headers (dict, optional): HTTP headers to include in the request
-            params (dict, optional): Query parameters to include in the request
-            **kwargs: Additional arguments to pass to the underlying request method
-
-        Returns:
-            urllib3.response.HTTPResponse: The HTTP response
-
-        Raises:
-            RequestError: If an error occurs during the request
-        """
-        # For DELETE requests, query parameters are passed as 'fields'
-        if params:
-            fields = params if fields is None else {**fields, **params}
-        return self.request('DELETE', url, fields=fields, headers=headers, **kwargs)
-
-    def head(self, url, fields=None, headers=None, params=None, **kwargs):
-        """Make a HEAD request.
-
-        Args:
-            url (str): URL to request
-            fields (dict, optional): Form fields to include in the request
-            headers (dict, optional): HTTP headers to include in the request
-            params (dict, optional): Query parameters to include in the request
-            **kwargs: Additional arguments to pass to the underlying request method
-
-        Returns:
-            urllib3.response.HTTPResponse: The HTTP response
-
-        Raises:
-            RequestError: If an error occurs during the request
-        """
-        # For HEAD requests, query parameters are passed as 'fields'
-        if params:
-            fields = params if fields is None else {**fields, **params}
-        return self.request('HEAD', url, fields=fields, headers=headers, **kwargs)
-
-    def options(self, url, fields=None, headers=None, params=None, **kwargs):
-        """Make an OPTIONS request.
-
-        Args:
-            url (str): URL to request
-            fields (dict, optional): Form fields to include in the request
-            headers (dict, optional): HTTP headers to include in the request
-            params (dict, optional): Query parameters to include in the request
-            **kwargs: Additional arguments to pass to the underlying request method
-
-        Returns:
-            urllib3.response.HTTPResponse: The HTTP response
-
-        Raises:
-            RequestError: If an error occurs during the request
-        """
-        # For OPTIONS requests, query parameters are passed as 'fields'
-        if params:
-            fields = params if fields is None else {**fields, **params}
-        return self.request('OPTIONS', url, fields=fields, headers=headers, **kwargs)
-
-    def patch(self, url, fields=None, headers=None, params=None, **kwargs):
-        """Make a PATCH request.
-
-        Args:
-            url (str): URL to request
-            fields (dict, optional): Form fields or JSON data to include in the request
-            headers (dict, optional): HTTP headers to include in the request
-            params (dict, optional): Query parameters to include in the request
-            **kwargs: Additional arguments to pass to the underlying request method
-
-        Returns:
-            urllib3.response.HTTPResponse: The HTTP response
-
-        Raises:
-            RequestError: If an error occurs during the request
-        """
-        # For PATCH requests, query parameters must be manually encoded in the URL
-        url = self._prepare_url(url, params)
-        return self.request('PATCH', url, fields=fields, headers=headers, **kwargs)
-
-    def trace(self, url, fields=None, headers=None, params=None, **kwargs):
-        """Make a TRACE request.
-
-        Args:
-            url (str): URL to request
-            fields (dict, optional): Form fields to include in the request
-            headers (dict, optional): HTTP headers to include in the request
-            params (dict, optional): Query parameters to include in the request
-            **kwargs: Additional arguments to pass to the underlying request method
-
-        Returns:
-            urllib3.response.HTTPResponse: The HTTP response
-
-        Raises:
-            RequestError: If an error occurs during the request
-        """
-        # For TRACE requests, query parameters are passed as 'fields'
-        if params:
-            fields = params if fields is None else {**fields, **params}
-        return self.request('TRACE', url, fields=fields, headers=headers, **kwargs)
+    get = _query_verb('GET')
+    post = _body_verb('POST')
+    put = _body_verb('PUT')
+    delete = _query_verb('DELETE')
+    head = _query_verb('HEAD')
+    options = _query_verb('OPTIONS')
+    patch = _body_verb('PATCH')
+    trace = _query_verb('TRACE')
 
     def close(self):
         """Close the connection and clear it from the cache.
 
-        Raises:
-            HTTPClientError: If an error occurs during the operation
+        The connection is detached from the model before closing it, so a failing close is
+        only logged and the next request gets a fresh connection.
         """
-        try:
-            # Get connection from class-level cache
-            connection = None
-            if self._name in self._connection_cache:
-                connection = self._connection_cache[self._name]
+        cls = type(self)
+        connection = cls.__dict__.get('_cached_connection')
 
-            if connection:
-                with self._handle_connection_exceptions(HTTPClientError):
-                    connection.close()
+        # Clear from the model class slot and the registry
+        cls._cached_connection = None
+        self._connection_cache.pop(cls, None)
 
-            # Clear from class-level cache
-            if self._name in self._connection_cache:
-                self._connection_cache[self._name] = None
+        if connection is None:
+            return
 
-            _logger.debug("Closed connection for %s", self._name)
+        try:
+            connection.close()
         except Exception as e:
-            _logger.error("Error closing connection for %s: %s", self._name, str(e))
-            raise HTTPClientError(f"Error closing connection for {self._name}: {str(e)}")
+            _logger.warning("Error closing connection for %s: %s", self._name, e)
+            return
+
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("Closed connection for %s", self._name)
@@ -1,17 +1,31 @@
 # -*- coding: utf-8 -*-
 
 from urllib3.poolmanager import PoolManager
+from urllib3.util import parse_url
 from typing import Dict
 
+import functools
 import urllib3
-import logging
 
 from .http_abstract import HTTPAbstract
 from .exceptions import (
     HTTPClientError, PoolManagerInitError,
 )
 
-_logger = logging.getLogger(__name__)
+# Default number of per-host pools kept by the PoolManager before the least recently used
+# one is evicted (and its keep-alive connections closed)
+_DEFAULT_NUM_POOLS = 64
+
+
+@functools.lru_cache(maxsize=256)
+def _split_pool_url(url):
+    """Return the (host, port, scheme) parts urllib3 uses to pick the pool of ``url``.
+
+    Only the parsing is cached, pools are still resolved by the PoolManager so evicted or
+    cleared pools are never handed out.
+    """
+    parsed = parse_url(url)
+    return parsed.host, parsed.port, parsed.scheme
 
 
 class PoolManagerAbstract(HTTPAbstract):
@@ -33,9 +47,8 @@ class PoolManagerAbstract(HTTPAbstract):
         """
         options = self._get_options()
 
-        # Set default num_pools if not specified
-        if 'num_pools' not in options:
-            options['num_pools'] = 10
+        # Set default num_pools if not specified, maxsize per host pool comes from _get_options()
+        options.setdefault('num_pools', _DEFAULT_NUM_POOLS)
 
         with self._handle_connection_exceptions(PoolManagerInitError):
             return PoolManager(**options)
@@ -56,17 +69,13 @@ class PoolManagerAbstract(HTTPAbstract):
             HTTPClientError: If an error occurs during the operation
         """
         conn = self._get_connection()
-        try:
-            with self._handle_connection_exceptions(HTTPClientError):
-                return conn.connection_from_host(
-                    host=host,
-                    port=port,
-                    scheme=scheme,
-                    pool_kwargs=pool_kwargs
-                )
-        except Exception as e:
-            _logger.error("Error getting connection from host %s:%s: %s", host, port, str(e))
-            raise HTTPClientError(f"Error getting connection from host {host}:{port}: {str(e)}")
+        with self._handle_connection_exceptions(HTTPClientError):
+            return conn.connection_from_host(
+                host=host,
+                port=port,
+                scheme=scheme,
+                pool_kwargs=pool_kwargs
+            )
 
     def connection_from_url(self, url, pool_kwargs=None):
         """Get a connection from the pool for the specified URL.
@@ -82,15 +91,14 @@ class PoolManagerAbstract(HTTPAbstract):
             HTTPClientError: If an error occurs during the operation
         """
         conn = self._get_connection()
-        try:
-            with self._handle_connection_exceptions(HTTPClientError):
-                return conn.connection_from_url(
-                    url=url,
-                    pool_kwargs=pool_kwargs
-                )
-        except Exception as e:
-            _logger.error("Error getting connection from URL %s: %s", url, str(e))
-            raise HTTPClientError(f"Error getting connection from URL {url}: {str(e)}")
+        with self._handle_connection_exceptions(HTTPClientError):
+            host, port, scheme = _split_pool_url(url)
+            return conn.connection_from_host(
+                host=host,
+                port=port,
+                scheme=scheme,
+                pool_kwargs=pool_kwargs
+            )
 
     def clear(self):
         """Clear the connection pools.
@@ -99,9 +107,5 @@ class PoolManagerAbstract(HTTPAbstract):
             HTTPClientError: If an error occurs during the operation
         """
         conn = self._get_connection()
-        try:
-            with self._handle_connection_exceptions(HTTPClientError):
-                conn.clear()
-        except Exception as e:
-            _logger.error("Error clearing connection pools: %s", str(e))
-            raise HTTPClientError(f"Error clearing connection pools: {str(e)}")
+        with self._handle_connection_exceptions(HTTPClientError):
+            conn.clear()
@@ -7,6 +7,7 @@ from odoo.exceptions import UserError, AccessError
 from contextlib import contextmanager
 from typing import Any, Dict, List
 
+import functools
 import logging
 
 _logger = logging.getLogger(__name__)
@@ -18,6 +19,8 @@ class HTTPSPoolWeb(models.AbstractModel):
     _inherit = 'https.pool.abstract'
     _description = 'HTTP Pool for odoo backend web view'
 
+    _push_batch_size = 100  # Buffered operations that trigger a push before the end of the transaction
+
     @api.model
     def search_fetch(self, domain, field_names, offset=0, limit=None, order=None):
         """
@@ -28,6 +31,10 @@ class HTTPSPoolWeb(models.AbstractModel):
         Provides robust error handling and leverages database savepoint for transactional
         safety during API fetch operations.
 
+        Returns:
+            The matching recordset, with 'field_names' fetched by the same SQL query. Call
+            '.read(field_names)' on it when a list of dictionaries is needed.
+
         Raises:
             UserError: Raised if an exception occurs during the API data fetch process and the
             context does not suppress the error ('not_raise' context is False).
@@ -36,28 +43,30 @@ class HTTPSPoolWeb(models.AbstractModel):
             try:
                 with cr.savepoint(flush=False):
                     self.with_context(no_fetch_data=True).fetch_data(cr)
-                    _logger.info("")
             except Exception as e:
-                _logger.error("")
-                if not self.env.context('not_raise', False):
+                _logger.error("Error fetching API data for %s: %s", self._name, e)
+                if not self.env.context.get('not_raise', False):
                     raise UserError(e)
 
-        return super(HTTPSPoolWeb, self).search_read(domain, field_names, offset=offset, limit=limit, order=order)
+        return super(HTTPSPoolWeb, self).search_fetch(domain, field_names, offset=offset, limit=limit, order=order)
 
     def write(self, vals):
         """ Override method for the model."""
-        self.push_data(self._prepare_context('write', vals=vals))
+        if self._is_push_enabled():
+            self._enqueue_push(self._prepare_context('write', vals=vals))
         return super(HTTPSPoolWeb, self).write(vals)
 
     def unlink(self):
         """ Override method for the model."""
-        self.push_data(self._prepare_context('unlink'))
+        if self._is_push_enabled():
+            self._enqueue_push(self._prepare_context('unlink'))
         return super(HTTPSPoolWeb, self).unlink()
 
     @api.model_create_multi
     def create(self, vals_list):
         """ Override method for the model."""
-        self.push_data(self._prepare_context('create', vals_list))
+        if self._is_push_enabled():
+            self._enqueue_push(self._prepare_context('create', vals_list))
         return super(HTTPSPoolWeb, self).create(vals_list)
 
     # Customs abstract's class methods
@@ -71,7 +80,7 @@ class HTTPSPoolWeb(models.AbstractModel):
         The function takes a method name, optional values, and an optional default context dictionary
         to construct a new context dictionary. The method name serves as the key, and the associated
         value is determined by processing the instance's records or the provided values. The function
-        handles exceptions related to access rights and update issues.
+        handles exceptions related to access rights.
 
         Parameters:
             method (str): The method name to be used as a key in the context dictionary.
@@ -83,17 +92,14 @@ class HTTPSPoolWeb(models.AbstractModel):
             Dict[str, List[Dict[str, Any]]]: A dictionary containing the prepared context with the
                 method name as the key and processed values for the given context.
         """
-        context = default_context is None and {} or default_context
-        vals = vals is None and [] or vals
+        context = default_context if default_context is not None else {}
+        vals = vals if vals is not None else []
 
         if isinstance(vals, dict):
             vals = [vals]
 
         try:
-            context.update([(method, {'vals': record and record.read() or vals for record in (self or [None])})])
-        except ValueError:
-            _logger.error("Not was possible fetch record using read")
-            context.update([(method, {})])
+            context.update([(method, {'vals': self._read_for_push(method) if self else vals})])
         except AccessError as e:
             _logger.error("Not possible get record data bcause not have enough access rights.")
             if not self.env.context.get('not_raise', False):
@@ -102,27 +108,79 @@ class HTTPSPoolWeb(models.AbstractModel):
 
         return context
 
+    def _is_push_enabled(self) -> bool:
+        """
+        Whether the model overrides 'push_data'.
+
+        The default 'push_data' does nothing, so models that do not override it skip reading and
+        buffering their records on write/unlink/create.
+        """
+        return type(self).push_data is not HTTPSPoolWeb.push_data
+
+    def _read_for_push(self, method: str) -> List[Dict[str, Any]]:
+        """
+        Read the records data sent to the API for the given method.
+
+        Override to restrict the fields pushed per method, e.g. 'self.read(['name'])' on unlink.
+        The ORM record cache already avoids fetching fields loaded earlier in the transaction.
+        """
+        return self.read()
+
+    def _enqueue_push(self, context: Dict[str, List[Dict[str, Any],]]) -> None:
+        """
+        Buffer a push context until the end of the current transaction.
+
+        The contexts of all the write/unlink/create calls made on the model in the transaction
+        are sent together by '_flush_push_buffer', registered as a precommit hook so a failing
+        push still aborts the commit. A push is also sent as soon as '_push_batch_size'
+        operations are buffered, so long transactions do not accumulate indefinitely.
+        """
+        precommit = self.env.cr.precommit
+        key = ('https.pool.web', self._name)
+        buffer = precommit.data.get(key)
+        if buffer is None:
+            buffer = precommit.data[key] = []
+            precommit.add(functools.partial(self.browse()._flush_push_buffer, key))
+        buffer.append(context)
+        if len(buffer) >= self._push_batch_size:
+            self._flush_push_buffer(key)
+
+    def _flush_push_buffer(self, key):
+        """
+        Push the buffered contexts stored under 'key' in a single call.
+
+        Contexts are merged by method, in the order methods were first seen:
+        {'create': {'vals': [...]}, 'write': {'vals': [...]}, ...}.
+        The buffer is detached before pushing, so operations made by 'push_data' itself (e.g.
+        storing the id returned by the API) are buffered anew and pushed by their own hook.
+        """
+        buffer = self.env.cr.precommit.data.pop(key, None)
+        if not buffer:
+            return None
+        context = {}
+        for buffered in buffer:
+            for method, data in buffered.items():
+                vals = data.get('vals')
+                if vals:
+                    context.setdefault(method, {'vals': []})['vals'].extend(vals)
+        return self._push_data(context)
+
     def _push_data(self, context: Dict[str, List[Dict[str, Any],]]):
         """
-        Push data to a specific method with the given context.
+        Push data to the methods of the given context.
 
-        This method extracts the method name and related data from the
-        provided context dictionary and initiates the data push operation.
-        If the extracted method or data is missing, the function returns None.
-        The function also safely handles web errors during the data push process
-        using the '_handle_web_error' context manager.
+        The context maps each method name to its data, several methods being pushed together
+        when operations are batched (see '_flush_push_buffer'). If no method has data, the
+        function returns None. The function also safely handles web errors during the data
+        push process using the '_handle_web_error' context manager.
 
         Raises:
             Any exceptions raised while pushing data are caught within the
             '_handle_web_error' context manager and handled appropriately.
         """
-        method = data = None
-        for key, value in context.items():
-            method = key
-            data = value
-        if not (method and data):
+        if not any(context.values()):
             return None
-        with self._handle_web_error(method):
+        with self._handle_web_error(', '.join(context)):
             return self.push_data(context)
 
     def push_data(self, context: Dict[str, List[Dict[str, Any],]]) -> None:
@@ -2,3 +2,4 @@
 
 from . import test_http_request_wizard
 from . import test_http_abstract_classes
+from . import test_https_pool_web
@@ -2,8 +2,11 @@
 
 from odoo.tests import TransactionCase
 from odoo.tests import tagged
+from urllib3.exceptions import LocationValueError, NewConnectionError, URLSchemeUnknown
 import json
 
+from ..models.exceptions import HTTPClientError
+
 
 @tagged('class_inheritance')
 class TestHttpAbstractClasses(TransactionCase):
@@ -47,6 +50,46 @@ class TestHttpAbstractClasses(TransactionCase):
         response = pool.delete('/delete')
         self.assertEqual(response.status, 200)
 
+    def test_prepare_url(self):
+        """Test query parameters encoding for POST/PUT/PATCH URLs"""
+        pool = self.http_pool
+        self.assertEqual(pool._prepare_url('/post'), '/post')
+        self.assertEqual(pool._prepare_url('/post', {'a': '1 2'}), '/post?a=1+2')
+        self.assertEqual(pool._prepare_url('/post?a=0&b=1', {'a': '2'}), '/post?a=2&b=1')
+        self.assertEqual(pool._prepare_url('/post#top', {'a': '1'}), '/post?a=1#top')
+
+    def test_connection_errors(self):
+        """Test that connection errors are wrapped with the message of their type, offline"""
+        with self.assertRaises(HTTPClientError) as error:
+            self.pool_manager.connection_from_host('')
+        self.assertIsInstance(error.exception.original_error, LocationValueError)
+        self.assertTrue(error.exception.args[0].startswith("Invalid connection parameters - Original error: "))
+
+        with self.assertRaises(HTTPClientError) as error:
+            self.pool_manager.connection_from_host('httpbin.org', scheme='foo')
+        self.assertIsInstance(error.exception.original_error, URLSchemeUnknown)
+        self.assertTrue(error.exception.args[0].startswith("Unknown URL scheme - Original error: "))
+
+        # NewConnectionError derives from ConnectTimeoutError, the most specific entry must win
+        with self.assertRaises(HTTPClientError) as error:
+            with self.pool_manager._handle_connection_exceptions(HTTPClientError):
+                raise NewConnectionError(None, "Connection refused")
+        self.assertIsInstance(error.exception.original_error, NewConnectionError)
+        self.assertTrue(error.exception.args[0].startswith("Failed to establish a new connection - Original error: "))
+
+    def test_request_many(self):
+        """Test concurrent requests over a single pool"""
+        requests = [
+            {'method': 'GET', 'url': '/get', 'fields': {'n': str(n)}}
+            for n in range(3)
+        ]
+        results = list(self.https_pool.request_many(requests))
+        self.assertEqual(len(results), 3)
+        for req, response in results:
+            self.assertEqual(response.status, 200)
+            data = json.loads(response.data.decode('utf-8'))
+            self.assertEqual(data['args'], req['fields'])
+
     def test_http_pool_abstract(self):
         """Test HTTP pool abstract class"""
         self._test_pool_abstract(self.http_pool)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from odoo.tests import TransactionCase, tagged
+from unittest.mock import patch
 import json
 
 
@@ -147,3 +148,60 @@ class TestHttpRequestWizard(TransactionCase):
         # Parse JSON response
         response = json.loads(wizard.response_json)
         self.assertEqual(response['args'], {'param1': 'value1', 'param2': 'value2'})
+
+    def test_parse(self):
+        """Test parsing of the headers and params text fields"""
+        wizard = self.wizard.copy({
+            'headers': '\n Content-Type : application/json \nX-Range: bytes=0-1\ninvalid line\n',
+            'params': 'param1=value1\n param2 = a=b \n',
+        })
+        self.assertEqual(wizard._parse('headers'), {
+            'Content-Type': 'application/json',
+            'X-Range': 'bytes=0-1',
+        })
+        self.assertEqual(wizard._parse('params', splitter='='), {'param1': 'value1', 'param2': 'a=b'})
+        self.assertEqual(wizard._parse('body'), {})
+
+    def test_make_requests(self):
+        """Test concurrent requests of several wizards"""
+        wizards = self.wizard.copy({'url': 'https://httpbin.org/get', 'params': 'n=1'})
+        wizards |= self.wizard.copy({'url': 'https://httpbin.org/get', 'params': 'n=2'})
+        wizards |= self.wizard.copy({'url': 'https://httpbin.org/status/404'})
+        wizards.make_requests()
+
+        self.assertEqual(wizards.mapped('response_status'), [200, 200, 404])
+        self.assertEqual(json.loads(wizards[0].response_json)['args'], {'n': '1'})
+        self.assertEqual(json.loads(wizards[1].response_json)['args'], {'n': '2'})
+
+    def test_requests_to_several_hosts(self):
+        """Test that each wizard reaches the host of its own URL"""
+        httpbin = self.wizard.copy({'url': 'https://httpbin.org/get'})
+        postman = self.wizard.copy({'url': 'https://postman-echo.com/get'})
+        httpbin.make_request()
+        postman.make_request()
+
+        self.assertEqual(json.loads(httpbin.response_json)['url'], 'https://httpbin.org/get')
+        self.assertEqual(json.loads(postman.response_json)['url'], 'https://postman-echo.com/get')
+
+    def test_make_request_uses_request_override(self):
+        """Test that the wizard sends its request through request(), so overrides apply"""
+        wizard = self.wizard.copy({'url': 'https://httpbin.org/get', 'method': 'get'})
+        wizard_class = type(wizard)
+        with patch.object(wizard_class, 'request', autospec=True, side_effect=wizard_class.request) as request:
+            wizard.make_request()
+
+        request.assert_called_once()
+        self.assertEqual(wizard.response_status, 200)
+
+    def test_make_requests_use_own_request(self):
+        """Test that each wizard of a batch sends its request through its own request()"""
+        wizards = self.wizard.copy({'url': 'https://httpbin.org/get', 'params': 'n=1'})
+        wizards |= self.wizard.copy({'url': 'https://httpbin.org/get', 'params': 'n=2'})
+        wizard_class = type(wizards)
+        with patch.object(wizard_class, 'request', autospec=True, side_effect=wizard_class.request) as request:
+            wizards.make_requests()
+
+        self.assertEqual(request.call_count, 2)
+        sent_fields = {call.args[0].id: call.kwargs['fields'] for call in request.call_args_list}
+        self.assertEqual(sent_fields[wizards[0].id], {'n': '1'})
+        self.assertEqual(sent_fields[wizards[1].id], {'n': '2'})
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests import TransactionCase
+from odoo.tests import tagged
+from unittest.mock import patch
+
+
+@tagged('web_push')
+class TestHttpsPoolWeb(TransactionCase):
+    """Test the buffered pushes of the web pool"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.web_pool = cls.env['https.pool.web']
+
+    def setUp(self):
+        super().setUp()
+        self.env.cr.precommit.clear()
+
+    def _patch_push_data(self):
+        """Helper method to patch the push_data of the web pool registry class"""
+        return patch.object(type(self.web_pool), 'push_data', autospec=True)
+
+    def test_is_push_enabled(self):
+        """Test that pushes are only enabled when push_data is overridden"""
+        self.assertFalse(self.web_pool._is_push_enabled())
+        with self._patch_push_data():
+            self.assertTrue(self.web_pool._is_push_enabled())
+
+    def test_push_merged_by_method(self):
+        """Test that the buffered contexts are merged by method into a single push"""
+        with self._patch_push_data() as push_data:
+            self.web_pool._enqueue_push({'create': {'vals': [{'id': 1}]}})
+            self.web_pool._enqueue_push({'write': {'vals': [{'id': 2}]}})
+            self.web_pool._enqueue_push({'create': {'vals': [{'id': 3}]}})
+            self.web_pool._enqueue_push({'unlink': {}})
+            push_data.assert_not_called()
+
+            self.env.cr.precommit.run()
+
+        push_data.assert_called_once()
+        self.assertEqual(push_data.call_args.args[1], {
+            'create': {'vals': [{'id': 1}, {'id': 3}]},
+            'write': {'vals': [{'id': 2}]},
+        })
+
+    def test_push_batch_size(self):
+        """Test that reaching _push_batch_size pushes before the end of the transaction"""
+        with self._patch_push_data() as push_data, \
+                patch.object(type(self.web_pool), '_push_batch_size', 2):
+            self.web_pool._enqueue_push({'create': {'vals': [{'id': 1}]}})
+            push_data.assert_not_called()
+            self.web_pool._enqueue_push({'write': {'vals': [{'id': 2}]}})
+            push_data.assert_called_once()
+            self.assertEqual(push_data.call_args.args[1], {
+                'create': {'vals': [{'id': 1}]},
+                'write': {'vals': [{'id': 2}]},
+            })
+
+            self.web_pool._enqueue_push({'unlink': {'vals': [{'id': 3}]}})
+            self.env.cr.precommit.run()
+
+        self.assertEqual(push_data.call_count, 2)
+        self.assertEqual(push_data.call_args.args[1], {'unlink': {'vals': [{'id': 3}]}})
+
+    def test_push_empty_contexts(self):
+        """Test that contexts without data are dropped and never pushed"""
+        with self._patch_push_data() as push_data:
+            self.web_pool._enqueue_push({'unlink': {}})
+            self.web_pool._enqueue_push({'write': {'vals': []}})
+            self.env.cr.precommit.run()
+
+        push_data.assert_not_called()
+
+    def test_push_from_push_data(self):
+        """Test that the operations made while pushing are pushed as well"""
+        pushed = []
+
+        def push_data(model, context):
+            pushed.append(context)
+            if len(pushed) == 1:
+                # e.g. store the remote id returned by the API
+                model._enqueue_push({'write': {'vals': [{'id': 1, 'remote_id': 10}]}})
+
+        with patch.object(type(self.web_pool), 'push_data', autospec=True, side_effect=push_data):
+            self.web_pool._enqueue_push({'create': {'vals': [{'id': 1}]}})
+            self.env.cr.precommit.run()
+
+        self.assertEqual(pushed, [
+            {'create': {'vals': [{'id': 1}]}},
+            {'write': {'vals': [{'id': 1, 'remote_id': 10}]}},
+        ])
@@ -2,14 +2,58 @@
 from typing import Dict
 
 from odoo import models, fields, api
+import functools
 import json
 import base64
 import mimetypes
+import re
+from urllib.parse import urlsplit
+
+# Load the MIME types database at server start rather than on the first binary response,
+# unless already done: init() would drop the types other modules registered with add_type()
+if not mimetypes.inited:
+    mimetypes.init()
+
+
+@functools.lru_cache(maxsize=None)
+def _line_pattern(splitter):
+    """Compiled pattern matching the stripped 'key<splitter>value' pairs of a text, one per line."""
+    splitter = re.escape(splitter)
+    return re.compile(rf'^[^\S\n]*([^{splitter}\n]*?)[^\S\n]*{splitter}[^\S\n]*(.*?)[^\S\n]*$', re.M)
+
+
+@functools.lru_cache(maxsize=256)
+def _ext_for(mime):
+    """File extension of a MIME type ('' if unknown), cached as endpoints keep returning the same types."""
+    return mimetypes.guess_extension(mime) or ''
+
+
+# Response processing methods by exact MIME type, then by MIME family ('image' for 'image/png')
+_RESPONSE_HANDLERS = {
+    'application/octet-stream': '_process_binary_response',
+    'application/json': '_process_json_response',
+    'text/html': '_process_html_response',
+}
+_RESPONSE_FAMILY_HANDLERS = {
+    'image': '_process_binary_response',
+    'audio': '_process_binary_response',
+    'video': '_process_binary_response',
+    'text': '_process_text_response',
+}
+
+# JSON responses larger than this (in bytes) are stored as received instead of pretty-printed
+_JSON_PRETTY_MAX_SIZE = 64 * 1024
+
+# Fields holding the response of the last request
+_RESPONSE_FIELDS = (
+    'response_status', 'response_headers', 'response_binary', 'response_filename',
+    'response_json', 'response_html', 'response_text', 'content_type',
+)
 
 
 class HttpRequestWizard(models.TransientModel):
     _name = 'http.request.wizard'
-    _inherit = 'https.pool.abstract'
+    _inherit = 'http.pool.manager.abstract'
     _description = 'HTTP Request Wizard'
 
     # Input fields
@@ -28,6 +72,9 @@ class HttpRequestWizard(models.TransientModel):
     headers = fields.Text(string='Headers', help="HTTP headers in key:value format, one per line")
     body = fields.Text(string='Request Body', help="Request body content")
 
+    # Absolute URL sent to the pool manager, parsed once when the URL changes
+    request_url = fields.Char(string='Request URL', compute='_compute_request_url', store=True)
+
     # Response fields
     response_status = fields.Integer(string='Status Code', readonly=True)
     response_headers = fields.Text(string='Response Headers', readonly=True)
@@ -41,37 +88,36 @@ class HttpRequestWizard(models.TransientModel):
     response_display = fields.Text(string='Response', compute='_compute_response_display')
     content_type = fields.Char(string='Content Type', readonly=True)
 
-    def _get_options(self):
-        """Override to extract host from URL"""
-        options = super(HttpRequestWizard, self)._get_options()
-
-        # Extract host from URL if not already set
-        if 'host' not in options and self.url:
-            # Remove protocol
-            url = self.url
-            if '://' in url:
-                url = url.split('://', 1)[1]
-
-            # Extract host
-            host = url.split('/', 1)[0]
-            if ':' in host:  # Handle port in host
-                host, port = host.split(':', 1)
-                options['port'] = int(port)
-
-            options['host'] = host
-
-        return options
+    def _split_url(self):
+        """Split the URL in its components, accepting URLs typed without a scheme"""
+        return urlsplit(self.url if '://' in self.url else f"//{self.url}")
+
+    def _get_request_url(self):
+        """Normalize the URL, the pool manager picks the pool of its scheme, host and port"""
+        parts = self._split_url()
+        url = f"{parts.scheme or 'https'}://{parts.netloc}{parts.path or '/'}"
+        if parts.query:
+            url = f"{url}?{parts.query}"
+        return url
+
+    @api.depends('url')
+    def _compute_request_url(self):
+        """Compute the absolute URL of the request"""
+        for record in self:
+            try:
+                record.request_url = record.url and record._get_request_url()
+            except ValueError:
+                # Invalid URL, the error is reported when the request is made
+                record.request_url = False
 
     def _parse(self, field: str, splitter=':', delimiter='\n'):
         """Pars from text field to dictionary"""
-        headers_dict = {}
         column = getattr(self, field)
-        if column:
-            for line in column.strip().split(delimiter):
-                if splitter in line:
-                    key, value = line.split(splitter, 1)
-                    headers_dict[key.strip()] = value.strip()
-        return headers_dict
+        if not column:
+            return {}
+        if delimiter != '\n':
+            column = column.replace(delimiter, '\n')
+        return dict(_line_pattern(splitter).findall(column))
 
     @api.depends('response_binary', 'response_json', 'response_html', 'response_text')
     def _compute_response_display(self):
@@ -91,144 +137,162 @@ class HttpRequestWizard(models.TransientModel):
     def make_request(self):
         """Make the HTTP request and process the response"""
         self.ensure_one()
+        return self._make_requests()[self]
 
-        # Clear previous response
-        self.response_status = False
-        self.response_headers = False
-        self.response_binary = False
-        self.response_filename = False
-        self.response_json = False
-        self.response_html = False
-        self.response_text = False
-        self.content_type = False
+    def make_requests(self):
+        """Make the HTTP requests of several wizards concurrently and process their responses.
+
+        Only the network round trips overlap (see request_many), so the batch takes about as long
+        as its slowest request. Hooks and ORM writes run in the calling thread.
+
+        Each request goes through the request() of its own wizard. With more than one request,
+        request() runs in worker threads sharing the caller's cursor: the stored fields of the
+        wizards are fetched beforehand, and overrides of request() must not query the database
+        otherwise (no self.env access, no read of other records).
+        """
+        self._make_requests()
+        return True
+
+    def _make_requests(self):
+        """Send the requests of the wizards and process their responses.
 
+        Returns:
+            dict: The action to return for each wizard
+        """
+        # Clear previous response
+        self.write(dict.fromkeys(_RESPONSE_FIELDS, False))
+
+        actions = {}
+        pending = {}
+        for wizard in self:
+            try:
+                request = wizard._prepare_request()
+
+                # Prevent make a request if _pre_request_hook return action to execute
+                action = wizard._pre_request_hook()
+                if action and isinstance(action, dict):
+                    actions[wizard] = action
+                    continue
+            except Exception as e:
+                actions[wizard] = wizard._process_response(e)
+                continue
+            pending[wizard] = dict(request, sender=wizard.request)
+
+        if pending:
+            # Workers must not hit the cursor, load the wizards fields in the calling thread
+            self.browse([wizard.id for wizard in pending]).fetch(
+                [name for name, field in self._fields.items() if field.store])
+            # The pool manager is shared by the wizards, whatever the host they request
+            wizards = {id(request): wizard for wizard, request in pending.items()}
+            first = next(iter(pending))
+            try:
+                responses = list(first.request_many(pending.values(), return_exceptions=True))
+            except Exception as e:
+                responses = [(request, e) for request in pending.values()]
+            for request, response in responses:
+                wizard = wizards[id(request)]
+                actions[wizard] = wizard._process_response(response)
+
+        return actions
+
+    def _prepare_request(self):
+        """Return the arguments of the request of the wizard, as accepted by request_many()"""
+        # initialize the params column used in get requests
+        params = None
+        # Parse headers
+        headers = self._parse('headers')
+
+        # Parse parameters just for get methods
+        if self.method == 'get':
+            params = self._parse('params', splitter='=', delimiter='\n')
+
+        return {
+            'method': self.method,
+            'url': self.request_url or self._get_request_url(),
+            'body': self.body if self.body else None,
+            'headers': headers,
+            'fields': params,
+        }
+
+    def _process_response(self, response):
+        """Store the response, or the error raised instead of it, and return the wizard action"""
+        # Response values, written at once when the response is processed
+        vals = {}
         try:
-            # initialize the params column used in get requests
-            params = None
-            # Parse headers
-            headers = self._parse('headers')
-
-            # Parse parameters just for get methods
-            if self.method == 'get':
-                params = self._parse('params', splitter='=', delimiter='\n')
-
-            # Extract path from URL
-            url = self.url
-            if '://' in url:
-                url = url.split('://', 1)[1]
-
-            path = '/'
-            if '/' in url and url.index('/') > 0:
-                path = '/' + url.split('/', 1)[1]
-
-            # Prevent make a request if _pre_request_hook return action to execute
-            action = self._pre_request_hook()
-            if action and isinstance(action, dict):
-                return action
-
-            # Make the request
-            response = self.request(
-                method=self.method,
-                url=path,
-                body=self.body if self.body else None,
-                headers=headers,
-                fields=params,
-            )
+            if isinstance(response, Exception):
+                raise response
 
             # Process response
-            self.response_status = response.status
+            vals['response_status'] = response.status
 
             # Process headers
-            headers_text = ""
-            for key, value in response.headers.items():
-                headers_text += f"{key}: {value}\n"
-            self.response_headers = headers_text
+            vals['response_headers'] = ''.join(f"{key}: {value}\n" for key, value in response.headers.items())
 
             # Get content type
             content_type = response.headers.get('Content-Type', '')
-            self.content_type = content_type
+            vals['content_type'] = content_type
 
-            # Process response body based on content type
+            # Process response body based on content type, HEAD responses and the like have none
             data = response.data
-
-            if content_type:
-                # Binary content
-                if 'application/octet-stream' in content_type or 'image/' in content_type or 'audio/' in content_type or 'video/' in content_type:
-                    self.response_binary = base64.b64encode(data)
-
-                    # Try to determine filename
-                    content_disposition = response.headers.get('Content-Disposition', '')
-                    if 'filename=' in content_disposition:
-                        filename = content_disposition.split('filename=', 1)[1].strip('"\'')
-                    else:
-                        # Generate filename based on content type
-                        ext = mimetypes.guess_extension(content_type.split(';')[0].strip()) or ''
-                        filename = f"response{ext}"
-
-                    self.response_filename = filename
-
-                # JSON content
-                elif 'application/json' in content_type:
-                    try:
-                        json_data = json.loads(data.decode('utf-8'))
-                        self.response_json = json.dumps(json_data, indent=2)
-                    except json.JSONDecodeError:
-                        self.response_text = data.decode('utf-8', errors='replace')
-
-                # HTML content
-                elif 'text/html' in content_type:
-                    self.response_html = data.decode('utf-8', errors='replace')
-
-                # Text content
-                elif 'text/' in content_type:
-                    self.response_text = data.decode('utf-8', errors='replace')
-
-                # Other content types
+            if data:
+                mime = content_type.split(';', 1)[0].strip().lower()
+                if mime:
+                    handler = _RESPONSE_HANDLERS.get(mime) or _RESPONSE_FAMILY_HANDLERS.get(
+                        mime.split('/', 1)[0], '_process_text_response')
                 else:
-                    try:
-                        # Try to decode as text
-                        self.response_text = data.decode('utf-8', errors='replace')
-                    except UnicodeDecodeError:
-                        # If it fails, treat as binary
-                        self.response_binary = base64.b64encode(data)
-                        self.response_filename = "response"
-            else:
-                # No content type, try to guess
-                try:
-                    # Try to parse as JSON
-                    json_data = json.loads(data.decode('utf-8'))
-                    self.response_json = json.dumps(json_data, indent=2)
-                except (json.JSONDecodeError, UnicodeDecodeError):
-                    try:
-                        # Try to decode as text
-                        self.response_text = data.decode('utf-8', errors='replace')
-                    except UnicodeDecodeError:
-                        # If it fails, treat as binary
-                        self.response_binary = base64.b64encode(data)
-                        self.response_filename = "response"
+                    # No content type, try to guess
+                    handler = '_process_json_response'
+                vals.update(getattr(self, handler)(response, data, mime))
+            self.write(vals)
 
             self._post_request_hook()
 
-            return {
-                'type': 'ir.actions.act_window',
-                'res_model': 'http.request.wizard',
-                'view_mode': 'form',
-                'res_id': self.id,
-                'target': 'new',
-                'context': self.env.context,
-            }
-
         except Exception as e:
-            self.response_text = f"Error: {str(e)}"
-            return {
-                'type': 'ir.actions.act_window',
-                'res_model': 'http.request.wizard',
-                'view_mode': 'form',
-                'res_id': self.id,
-                'target': 'new',
-                'context': self.env.context,
-            }
-
+            vals['response_text'] = f"Error: {str(e)}"
+            self.write(vals)
+
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': 'http.request.wizard',
+            'view_mode': 'form',
+            'res_id': self.id,
+            'target': 'new',
+            'context': self.env.context,
+        }
+
+    def _process_binary_response(self, response, data, mime):
+        """Return the values storing a binary response body and a filename for it"""
+        # b64encode reads the bytes in place, a memoryview or chunked encoding would not save a copy
+        response_binary = base64.b64encode(data)
+
+        # Try to determine filename
+        content_disposition = response.headers.get('Content-Disposition', '')
+        if 'filename=' in content_disposition:
+            filename = content_disposition.split('filename=', 1)[1].strip('"\'')
+        else:
+            # Generate filename based on content type
+            filename = f"response{_ext_for(mime)}"
+
+        return {'response_binary': response_binary, 'response_filename': filename}
+
+    def _process_json_response(self, response, data, mime):
+        """Return the values storing a pretty-printed JSON response body, or text if it is not JSON"""
+        try:
+            json_data = json.loads(data)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return self._process_text_response(response, data, mime)
+        if len(data) > _JSON_PRETTY_MAX_SIZE:
+            # Too large to be read comfortably anyway, keep the body as received
+            return {'response_json': data.decode('utf-8', errors='replace')}
+        return {'response_json': json.dumps(json_data, indent=2, ensure_ascii=False)}
+
+    def _process_html_response(self, response, data, mime):
+        """Return the values storing an HTML response body"""
+        return {'response_html': data.decode('utf-8', errors='replace')}
+
+    def _process_text_response(self, response, data, mime):
+        """Return the values storing a response body as text"""
+        return {'response_text': data.decode('utf-8', errors='replace')}
 
     def _pre_request_hook(self) -> Dict:
         """Hook to execute before sending the request"""